@@ -2,6 +2,7 @@ package tts
 
 import (
 	"context"
+	"encoding/binary"
 	"fmt"
 	"io"
 	"os"
@@ -9,11 +10,11 @@ import (
 	"regexp"
 	"sort"
 	"strings"
-	"time"
 
 	ttsv1 "github.com/vjovkovs/goparser/api/tts/v1"
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/credentials/insecure"
+	_ "google.golang.org/grpc/encoding/gzip" // accept gzip-compressed audio streams
 )
 
 // Options for Kokoro.
@@ -105,8 +106,6 @@ func (e *KokoroEngine) SynthesizeText(ctx context.Context, text, outDir, baseNam
 			return nil, fmt.Errorf("chunk %d: %w", i+1, err)
 		}
 		files = append(files, outPath)
-		// tiny delay to be gentle on the server
-		time.Sleep(30 * time.Millisecond)
 	}
 
 	// Keep concat.txt around for reference (ffmpeg concat style), even though we have a Go combiner.
@@ -150,9 +149,44 @@ func (e *KokoroEngine) synthesizeOne(ctx context.Context, text, outPath string)
 			return werr
 		}
 	}
+	if strings.EqualFold(filepath.Ext(outPath), ".wav") {
+		if err := fixStreamedWAVSizes(f); err != nil {
+			return fmt.Errorf("fix wav header: %w", err)
+		}
+	}
 	return nil
 }
 
+// fixStreamedWAVSizes patches the RIFF and data sizes of a WAV written from a
+// stream. The server sends the header before the audio length is known and uses
+// the streamed-WAV placeholder 0xFFFFFFFF for both sizes.
+func fixStreamedWAVSizes(f *os.File) error {
+	st, err := f.Stat()
+	if err != nil {
+		return err
+	}
+	size := st.Size()
+	if size < 44 {
+		return nil
+	}
+	var hdr [44]byte
+	if _, err := f.ReadAt(hdr[:], 0); err != nil {
+		return err
+	}
+	if string(hdr[0:4]) != "RIFF" || string(hdr[36:40]) != "data" ||
+		binary.LittleEndian.Uint32(hdr[40:44]) != 0xFFFFFFFF {
+		return nil
+	}
+	var b [4]byte
+	binary.LittleEndian.PutUint32(b[:], uint32(size-8))
+	if _, err := f.WriteAt(b[:], 4); err != nil {
+		return err
+	}
+	binary.LittleEndian.PutUint32(b[:], uint32(size-44))
+	_, err = f.WriteAt(b[:], 40)
+	return err
+}
+
 // ----------------- text split helpers (same as before) -----------------
 
 func splitSmart(text string, maxChars int) []string {
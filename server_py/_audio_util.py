@@ -0,0 +1,90 @@
+"""
+Audio helpers shared by kokoro_cli.py and kokoro_server.py.
+"""
+
+import io
+import struct
+import sys
+import wave
+
+import numpy as np
+
+from _pcm import f32_to_pcm16
+
+
+def as_samples(audio) -> np.ndarray:
+    """
+    View Kokoro output (a torch tensor or array-like) as a 1-D array, without
+    copying where possible. CPU tensors come back as zero-copy views; tensors on
+    an accelerator are scaled, clipped and cast to int16 there, so only half the
+    bytes cross the bus.
+    """
+    torch = sys.modules.get("torch")  # only ever a tensor if torch is loaded
+    if torch is not None and isinstance(audio, torch.Tensor):
+        t = audio.detach().reshape(-1)
+        if t.device.type != "cpu":
+            t = t.mul(32767.0).clamp_(-32767.0, 32767.0).round_().to(torch.int16)
+            return t.cpu().numpy()
+        return t.numpy()
+    return np.asarray(audio).reshape(-1)
+
+
+def float_to_pcm16(audio, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Scale float samples in [-1, 1] to 16-bit PCM in a single pass, into `out`
+    if given. float32 input may be used as scratch space, so the caller's
+    buffer can be clobbered; only pass arrays you own.
+    """
+    a = as_samples(audio)
+    if a.dtype == np.int16:  # already converted on the device
+        if out is None:
+            return a
+        out[:] = a
+        return out
+    a = np.asarray(a, dtype=np.float32)
+    if not a.flags.writeable:
+        a = a.copy()
+    if out is None:
+        out = np.empty(a.size, dtype=np.int16)
+    f32_to_pcm16(a, out)
+    return out
+
+
+def audio_to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
+    # int16 input is already PCM; anything else is float samples in [-1, 1]
+    pcm = audio if audio.dtype == np.int16 else float_to_pcm16(audio)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)  # 16-bit
+        w.setframerate(sample_rate)
+        w.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+# Size placeholder for WAV streams whose length isn't known up front
+WAV_STREAM_LEN = 0xFFFFFFFF
+
+
+def wav_header(nchannels: int, sampwidth: int, framerate: int, data_len: int) -> bytes:
+    """
+    Canonical 44-byte PCM WAV header for `data_len` bytes of sample data.
+    Pass WAV_STREAM_LEN when streaming audio of unknown length.
+    """
+    block = nchannels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        min(36 + data_len, WAV_STREAM_LEN),
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        nchannels,
+        framerate,
+        framerate * block,
+        block,
+        sampwidth * 8,
+        b"data",
+        data_len,
+    )
@@ -0,0 +1,47 @@
+"""
+Per-process cache of Kokoro pipelines, shared by kokoro_cli.py and kokoro_server.py.
+"""
+
+import functools
+import os
+
+from kokoro import KPipeline
+
+
+@functools.lru_cache(maxsize=8)
+def get_pipeline(lang: str, repo: str) -> KPipeline:
+    # pass repo_id to suppress "Defaulting repo_id ..." warning
+    return KPipeline(lang_code=lang, repo_id=repo)
+
+
+def warm_pipeline(lang: str, repo: str):
+    """
+    Load the pipeline now rather than on the first synthesis call.
+    """
+    get_pipeline(lang, repo)
+
+
+def set_torch_threads(n: int):
+    """
+    Cap torch's intra-/inter-op thread pools (and OpenMP/MKL) at `n` threads.
+    torch is already imported by the time this runs, so the calls are what
+    count; the env vars cover libraries and processes started afterwards.
+    """
+    import torch
+
+    os.environ["OMP_NUM_THREADS"] = str(n)
+    os.environ["MKL_NUM_THREADS"] = str(n)
+    torch.set_num_threads(n)
+    try:
+        torch.set_num_interop_threads(n)
+    except RuntimeError:
+        pass  # only settable before this process's first inter-op parallel work
+
+
+def init_worker(lang: str, repo: str, threads: int):
+    """
+    Process-pool initializer: pin thread counts so N workers don't each spin
+    up a pool per core, then load the pipeline before the worker's first task.
+    """
+    set_torch_threads(threads)
+    warm_pipeline(lang, repo)
@@ -0,0 +1,47 @@
+"""
+float32 -> int16 PCM conversion kernel.
+
+Uses a single-pass Numba kernel when numba is installed and falls back to
+in-place NumPy otherwise. The kernel is deliberately serial: it is called from
+gRPC handler threads, the CLI's writer thread and forked pool workers, none of
+which mix well with Numba's parallel threading layers, and on a per-segment
+buffer the auto-vectorized loop is memory-bound anyway.
+
+Either way `a` must be a writable 1-D float32 array the caller owns (the
+fallback uses it as scratch space).
+"""
+
+import numpy as np
+
+try:
+    import numba as nb
+except ImportError:  # optional; NumPy fallback below
+    nb = None
+
+
+if nb is not None:
+
+    @nb.njit(cache=True, fastmath=True)
+    def f32_to_pcm16(a, out):
+        for i in range(a.size):
+            v = a[i] * 32767.0
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32767.0:
+                v = -32767.0
+            out[i] = np.int16(np.rint(v))
+
+else:
+
+    def f32_to_pcm16(a, out):
+        np.multiply(a, 32767.0, out=a)
+        np.clip(a, -32767.0, 32767.0, out=a)
+        np.rint(a, out=a)
+        out[:] = a
+
+
+def warm():
+    """
+    Compile the kernel now (e.g. at server startup) rather than on the first request.
+    """
+    f32_to_pcm16(np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.int16))
@@ -1,20 +1,31 @@
 
 import argparse
-import io
+import hashlib
+import itertools
 import json
 import os
+import queue
 import re
 import shutil
+import stat
+import struct
 import subprocess
 import sys
+import threading
 import time
 import warnings
 import wave
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
 from kokoro import KPipeline  # pip install kokoro
 
+from _audio_util import as_samples, audio_to_wav_bytes, float_to_pcm16, wav_header
+from _kokoro_pool import get_pipeline, init_worker, set_torch_threads, warm_pipeline
+
 DEFAULT_SR = 24000
 
 
@@ -106,17 +117,38 @@ def list_voices(catalog: dict):
 # Files & text utils
 # ----------------------------
 
-def collect_inputs(path: Path, recursive: bool) -> list[Path]:
+_WS_RE = re.compile(r"[ \t\f\v]+")
+# Greedy sentence-ish segments (+ paragraph breaks)
+_SENT_RE = re.compile(r"(?s).+?(?:[\.!\?]+[\"\')\]]*\s+|\n{2,}|$)")
+_SLUG_NONWORD_RE = re.compile(r"[^\w\s-]+")
+_SLUG_WS_RE = re.compile(r"[\s_]+")
+
+
+def collect_inputs(path: Path, recursive: bool) -> Iterator[Path]:
+    """
+    Lazily yield .txt files via os.scandir. Each directory's files come out
+    sorted by name, followed by its subdirectories (also sorted), so the order
+    is deterministic without materializing and sorting the whole tree.
+    """
     if path.is_file():
-        return [path] if path.suffix.lower() == ".txt" else []
-    pat = "**/*.txt" if recursive else "*.txt"
-    return sorted(path.glob(pat))
+        if path.suffix.lower() == ".txt":
+            yield path
+        return
+    with os.scandir(path) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for e in entries:
+        if e.name.lower().endswith(".txt") and e.is_file():
+            yield Path(e.path)
+    if recursive:
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                yield from collect_inputs(Path(e.path), recursive)
 
 
 def slug(s: str) -> str:
     s = s.strip().lower()
-    s = re.sub(r"[^\w\s-]+", "-", s)
-    s = re.sub(r"[\s_]+", "-", s)
+    s = _SLUG_NONWORD_RE.sub("-", s)
+    s = _SLUG_WS_RE.sub("-", s)
     s = s.strip("-")
     return (s or "audiofile")[:64]
 
@@ -125,122 +157,258 @@ def read_text(p: Path) -> str:
     return p.read_text(encoding="utf-8", errors="ignore")
 
 
+def _normalize_text(text: str) -> str:
+    s = text.replace("\r\n", "\n")
+    return _WS_RE.sub(" ", s)
+
+
+def _chunk_spans(s: str, max_chars: int) -> list[tuple[int, int]]:
+    """
+    Single left-to-right pass over normalized text, returning whitespace-trimmed
+    (start, end) offsets of each chunk. Sentences are matched in place with
+    finditer and chunks are tracked as offsets, so no per-sentence strings are built.
+    """
+    spans: list[tuple[int, int]] = []
+
+    def emit(a: int, b: int):
+        while a < b and s[a].isspace():
+            a += 1
+        while b > a and s[b - 1].isspace():
+            b -= 1
+        spans.append((a, b))
+
+    # current chunk is s[start:end]; matches are contiguous, so it only ever grows at `end`
+    start = end = 0
+    for m in _SENT_RE.finditer(s):
+        a, b = m.span()
+        if end > start and (end - start) + (b - a) > max_chars:
+            emit(start, end)
+            start = end = a
+        if b - a > max_chars:
+            # Hard-wrap a very long sentence
+            r = a
+            while b - r > max_chars:
+                cut = s.rfind(" ", r, r + max_chars) - r
+                if cut <= 0:
+                    cut = max_chars
+                emit(r, r + cut)
+                r += cut
+                while r < b and s[r].isspace():
+                    r += 1
+            start = r
+        end = b
+
+    if end > start:
+        emit(start, end)
+
+    return spans
+
+
 def split_smart(text: str, max_chars: int) -> list[str]:
     """
     Soft sentence-based chunking with a hard wrap for outliers.
     """
-    s = text.replace("\r\n", "\n")
-    s = re.sub(r"[ \t\f\v]+", " ", s)
+    s = _normalize_text(text)
+    return [s[a:b] for a, b in _chunk_spans(s, max_chars)]
 
-    # Greedy sentence-ish segments (+ paragraph breaks)
-    sents = re.findall(r"(?s).+?(?:[\.!\?]+[\"\')\]]*\s+|\n{2,}|$)", s)
 
-    chunks: list[str] = []
-    cur: list[str] = []
-    cur_len = 0
+# Bump whenever _chunk_spans would return different offsets for the same input
+_CHUNK_CACHE_VERSION = 2
 
-    def flush():
-        nonlocal cur, cur_len, chunks
-        if cur_len > 0:
-            chunks.append("".join(cur).strip())
-            cur, cur_len = [], 0
 
-    for sen in sents:
-        if cur_len + len(sen) > max_chars and cur_len > 0:
-            flush()
-        if len(sen) > max_chars:
-            # Hard-wrap a very long sentence
-            remains = sen
-            while len(remains) > max_chars:
-                cut = remains.rfind(" ", 0, max_chars)
-                if cut <= 0:
-                    cut = max_chars
-                cur.append(remains[:cut] + "\n")
-                cur_len += cut + 1
-                flush()
-                remains = remains[cut:].lstrip()
-            if remains:
-                cur.append(remains)
-                cur_len += len(remains)
-        else:
-            cur.append(sen)
-            cur_len += len(sen)
+def _valid_spans(entry, s: str) -> bool:
+    """
+    Check a cached {"n": len(s), "spans": [...]} entry against the normalized
+    text: strictly increasing, non-overlapping, in-bounds [start, end] pairs
+    with only whitespace outside them, so a truncated or stale file can't
+    silently drop text.
+    """
+    if not isinstance(entry, dict) or entry.get("n") != len(s):
+        return False
+    spans = entry.get("spans")
+    if not isinstance(spans, list):
+        return False
+    prev_end = -1
+    for sp in spans:
+        if not (isinstance(sp, list) and len(sp) == 2 and all(type(x) is int for x in sp)):
+            return False
+        a, b = sp
+        if not (max(prev_end, 0) <= a <= b <= len(s) and b > prev_end):
+            return False
+        if s[max(prev_end, 0) : a].strip():
+            return False
+        prev_end = b
+    return not s[max(prev_end, 0) :].strip()
+
+
+def _chunks_cached(text: str, max_chars: int, cache_dir: Path | None) -> list[str]:
+    """
+    split_smart() with chunk offsets persisted under cache_dir, keyed by the
+    cache version, the text's SHA-256 and max_chars. Best-effort: unreadable,
+    malformed or unwritable cache files just mean recomputing. cache_dir=None
+    disables the cache.
+    """
+    if cache_dir is None:
+        return split_smart(text, max_chars)
+    s = _normalize_text(text)
+    h = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+    cache_p = cache_dir / f"v{_CHUNK_CACHE_VERSION}-{h}-{max_chars}.json"
+    try:
+        entry = json.loads(cache_p.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        entry = None
+    if _valid_spans(entry, s):
+        spans = entry["spans"]
+    else:
+        spans = _chunk_spans(s, max_chars)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # pool workers may race on the same text; publish atomically
+            tmp = cache_p.with_name(f"{cache_p.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"n": len(s), "spans": spans}), encoding="utf-8")
+            os.replace(tmp, cache_p)
+        except OSError:
+            pass
+    return [s[a:b] for a, b in spans]
 
-    if cur_len > 0:
-        flush()
 
-    return chunks
+def _chunk_cache_dir(args) -> Path | None:
+    return None if args.no_chunk_cache else Path(args.out) / ".cache" / "chunks"
 
 
 # ----------------------------
 # Audio I/O
 # ----------------------------
 
-def audio_to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
-    pcm = np.clip(audio, -1.0, 1.0)
-    pcm = (pcm * 32767.0).astype(np.int16)
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as w:
-        w.setnchannels(1)
-        w.setsampwidth(2)  # 16-bit
-        w.setframerate(sample_rate)
-        w.writeframes(pcm.tobytes())
-    return buf.getvalue()
-
-
 def write_wav_file(path: Path, audio: np.ndarray, sample_rate: int):
     path.parent.mkdir(parents=True, exist_ok=True)
     data = audio_to_wav_bytes(audio, sample_rate)
-    path.write_bytes(data)
+    # write + rename, so an interrupted run never leaves a truncated WAV behind
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def read_wav_pcm16(path: Path) -> np.ndarray:
+    with wave.open(str(path), "rb") as r:
+        return np.frombuffer(r.readframes(r.getnframes()), dtype=np.int16)
+
+
+def _wav_data_span(p: Path) -> tuple[tuple, int, int]:
+    """
+    Return (params, offset, nbytes) of the sample data inside a PCM WAV file.
+    """
+    with wave.open(str(p), "rb") as r:
+        params = r.getparams()
+    nbytes = params.nframes * params.nchannels * params.sampwidth
+    with open(p, "rb") as fh:
+        fh.seek(12)  # RIFF <size> WAVE
+        while True:
+            hdr = fh.read(8)
+            if len(hdr) < 8:
+                raise RuntimeError(f"no data chunk in {p}")
+            cid, size = struct.unpack("<4sI", hdr)
+            if cid == b"data":
+                return params, fh.tell(), nbytes
+            fh.seek(size + (size & 1), os.SEEK_CUR)
+
+
+def _check_wavs(wavs: list[Path]) -> list[tuple[tuple, int, int]]:
+    """
+    Return the data span of each WAV, raising if their formats differ.
+    """
+    spans = [_wav_data_span(p) for p in wavs]
+    p0 = spans[0][0]
+    for p, (pi, _, _) in zip(wavs[1:], spans[1:]):
+        if (pi.nchannels, pi.sampwidth, pi.framerate) != (
+            p0.nchannels,
+            p0.sampwidth,
+            p0.framerate,
+        ):
+            raise RuntimeError(f"format mismatch in {p}")
+    return spans
+
+
+def _write_combined(wavs: list[Path], spans: list[tuple[tuple, int, int]], dst):
+    """
+    Write one WAV header followed by every part's sample bytes to `dst`.
+    """
+    p0 = spans[0][0]
+    total = sum(nbytes for _, _, nbytes in spans)
+    dst.write(wav_header(p0.nchannels, p0.sampwidth, p0.framerate, total))
+    for p, (_, offset, nbytes) in zip(wavs, spans):
+        with open(p, "rb") as src:
+            _copy_data(p, src, offset, nbytes, dst)
+
+
+def _copy_data(p: Path, src, offset: int, nbytes: int, dst):
+    """
+    Append `nbytes` of `src` starting at `offset` to `dst`. Between regular
+    files on Linux the kernel copies them with os.copy_file_range, never
+    passing the data through userspace; pipes, other platforms, or a kernel
+    that refuses the call use a bounded read/write loop.
+    """
+    if hasattr(os, "copy_file_range") and stat.S_ISREG(os.fstat(dst.fileno()).st_mode):
+        dst.flush()
+        dst_off = dst.tell()
+        try:
+            while nbytes > 0:
+                n = os.copy_file_range(src.fileno(), dst.fileno(), nbytes, offset, dst_off)
+                if n == 0:
+                    raise RuntimeError(f"truncated data chunk in {p}")
+                offset += n
+                dst_off += n
+                nbytes -= n
+        except OSError:
+            pass  # e.g. EXDEV/ENOSYS; finish below from where we stopped
+        finally:
+            dst.seek(dst_off)
+    src.seek(offset)
+    while nbytes > 0:
+        buf = src.read(min(nbytes, 1 << 20))
+        if not buf:
+            raise RuntimeError(f"truncated data chunk in {p}")
+        dst.write(buf)
+        nbytes -= len(buf)
 
 
 def combine_wavs(wavs: list[Path], out_wav: Path):
     """
     Concatenate multiple WAV files. All must share the same params.
+    Sample data is copied byte-for-byte after a single header; nothing is decoded.
     """
     assert wavs, "no wavs to combine"
     out_wav.parent.mkdir(parents=True, exist_ok=True)
-
-    def read_wave(p: Path):
-        with wave.open(str(p), "rb") as r:
-            params = r.getparams()  # nchannels, sampwidth, framerate, nframes, ...
-            frames = r.readframes(r.getnframes())
-        return params, frames
-
-    p0, f0 = read_wave(wavs[0])
-    with wave.open(str(out_wav), "wb") as w:
-        w.setparams(p0)
-        w.writeframes(f0)
-        for p in wavs[1:]:
-            pi, fi = read_wave(p)
-            if (pi.nchannels, pi.sampwidth, pi.framerate) != (
-                p0.nchannels,
-                p0.sampwidth,
-                p0.framerate,
-            ):
-                raise RuntimeError(f"format mismatch in {p}")
-            w.writeframes(fi)
+    spans = _check_wavs(wavs)
+    with open(out_wav, "wb") as dst:
+        _write_combined(wavs, spans, dst)
 
 
 def which(name: str) -> str | None:
     return shutil.which(name)
 
 
-def encode_mp3(in_wav: Path, out_mp3: Path) -> tuple[bool, str]:
+def start_encode_mp3(wavs: list[Path], out_mp3: Path) -> tuple[subprocess.Popen | None, str]:
     """
-    Encode to MP3 via lame or ffmpeg. Returns (ok, encoder_name).
+    Start encoding the concatenation of `wavs` to MP3 via lame or ffmpeg.
+    The combined WAV is piped into the encoder's stdin from a background
+    thread, so it never touches disk. Returns (process, encoder_name), or
+    (None, "") if no encoder is installed.
     """
+    assert wavs, "no wavs to encode"
     lame = which("lame")
     ffm = which("ffmpeg")
     cmd, name = None, ""
     if lame:
-        cmd, name = [lame, "--silent", "-V2", str(in_wav), str(out_mp3)], "lame"
+        cmd, name = [lame, "--silent", "-V2", "-", str(out_mp3)], "lame"
     elif ffm:
         cmd, name = [
             ffm,
             "-y",
+            "-f",
+            "wav",
             "-i",
-            str(in_wav),
+            "-",
             "-vn",
             "-ar",
             "44100",
@@ -251,26 +419,42 @@ def encode_mp3(in_wav: Path, out_mp3: Path) -> tuple[bool, str]:
             str(out_mp3),
         ], "ffmpeg"
     else:
-        return False, ""
+        return None, ""
+    spans = _check_wavs(wavs)
     out_mp3.parent.mkdir(parents=True, exist_ok=True)
-    ok = subprocess.call(cmd) == 0
-    return ok, name
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def feed():
+        try:
+            _write_combined(wavs, spans, proc.stdin)
+        except BrokenPipeError:
+            pass  # encoder exited early; its return code says why
+        except Exception:
+            proc.kill()  # don't let a truncated WAV encode "successfully"
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    threading.Thread(target=feed, daemon=True).start()
+    return proc, name
 
 
 # ----------------------------
 # Kokoro synth
 # ----------------------------
 
-def synth_file(pipeline: KPipeline, text: str, voice: str, speed: float) -> np.ndarray:
+def synth_segments(pipeline: KPipeline, chunks: list[str], voice: str, speed: float):
     """
-    Kokoro yields (graphemes, phonemes, audio) segments. Concatenate audio to one array.
+    Feed all chunks to a single Kokoro pipeline call (voice pack loaded once)
+    and yield (chunk_no, audio) per Kokoro segment, chunk_no 1-based. A long
+    chunk may come back as several consecutive segments; chunks that produce
+    no audio are skipped, so callers should check numbering.
     """
-    parts = []
-    for _, _, audio in pipeline(text, voice=voice, speed=float(speed)):
-        parts.append(np.asarray(audio, dtype=np.float32).flatten())
-    if not parts:
-        raise RuntimeError("kokoro produced no audio")
-    return np.concatenate(parts, axis=0)
+    for res in pipeline(chunks, voice=voice, speed=float(speed)):
+        if res.audio is not None:
+            yield res.text_index + 1, res.audio
 
 
 # ----------------------------
@@ -292,6 +476,310 @@ def _print_progress(prefix: str, i: int, n: int, start_t: float, quiet: bool):
     print(f"{prefix} [{i}/{n}]  elapsed={elapsed:0.1f}s  eta={eta:0.1f}s", flush=True)
 
 
+# ----------------------------
+# Per-file synthesis (pool worker)
+# ----------------------------
+
+def _part_path(parts_dir: Path, base: str, i: int) -> Path:
+    return parts_dir / f"{base}-part-{i:04d}.wav"
+
+
+def _is_up_to_date(out: Path, src: Path) -> bool:
+    try:
+        return out.stat().st_mtime >= src.stat().st_mtime
+    except OSError:
+        return False
+
+
+def _part_reusable(wav_p: Path, src: Path, rate: int) -> bool:
+    """
+    A part from an earlier run is reused if it is newer than the input and is a
+    complete, non-empty WAV in the format we'd write now.
+    """
+    if not _is_up_to_date(wav_p, src):
+        return False
+    try:
+        with wave.open(str(wav_p), "rb") as r:
+            p = r.getparams()
+    except (OSError, EOFError, wave.Error):
+        return False
+    return (p.nchannels, p.sampwidth, p.framerate) == (1, 2, rate) and p.nframes > 0
+
+
+_MANIFEST_NAME = "manifest.json"
+
+
+def _chunk_digest(chunk: str) -> str:
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()[:16]
+
+
+def _read_manifest(parts_dir: Path, settings: dict) -> list | None:
+    """
+    Return the chunk digest recorded for each part in parts_dir (None for parts
+    not known to be complete), or None if there is no manifest or it was
+    written with different synthesis settings.
+    """
+    try:
+        m = json.loads((parts_dir / _MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(m, dict) or m.get("settings") != settings:
+        return None
+    parts = m.get("parts")
+    return parts if isinstance(parts, list) else None
+
+
+def _write_manifest(parts_dir: Path, settings: dict, parts: list):
+    p = parts_dir / _MANIFEST_NAME
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_text(json.dumps({"settings": settings, "parts": parts}), encoding="utf-8")
+    os.replace(tmp, p)
+
+
+def _part_writer(q: queue.Queue, errors: list[tuple[Path, Exception]], record):
+    """
+    Writer thread: drain (path, audio, rate, index) items until None, calling
+    record(index) once each part is on disk. After the first failure it keeps
+    draining, so the producer never blocks on a full queue.
+    """
+    while True:
+        item = q.get()
+        if item is None:
+            return
+        if errors:
+            continue
+        wav_p, audio, rate, i = item
+        try:
+            write_wav_file(wav_p, audio, rate)
+            record(i)
+        except Exception as ex:
+            errors.append((wav_p, ex))
+
+
+def _partial_mp3(out_mp3: Path) -> Path:
+    # keeps the .mp3 suffix so ffmpeg can still infer the output format
+    return out_mp3.with_name(out_mp3.stem + ".part.mp3")
+
+
+def _part_paths(file_entry: dict) -> list[Path]:
+    parts_dir = Path(file_entry["parts_dir"])
+    return [
+        _part_path(parts_dir, file_entry["base"], i)
+        for i in range(1, file_entry["chunks"] + 1)
+    ]
+
+
+def _synth_one_file(job: tuple) -> dict:
+    """
+    Synthesize one input file into parts and, for --final wav, the full WAV.
+    Top-level so it can be pickled into a process pool. MP3 encoding is left
+    to the caller so it can overlap with the next file. Returns file_entry.
+    """
+    f, args, voice_id, lang, out_root, verbose, quiet = job
+    pipe = get_pipeline(lang, args.repo)
+    prog_on = _progress_enabled(args.progress)
+
+    started = time.perf_counter()
+    base = slug(f.stem)
+    item_root = out_root / base
+    parts_dir = item_root / "parts"
+    parts_dir.mkdir(parents=True, exist_ok=True)
+
+    if not quiet:
+        print(f"\n=== Synthesizing {f} -> {item_root} ===", flush=True)
+
+    text = read_text(f)
+    chunks = _chunks_cached(text, max(400, args.max), _chunk_cache_dir(args))
+    if verbose:
+        log(f"Chunks: {len(chunks)}  (max={args.max})")
+
+    # Parts are only trusted if the manifest says they were synthesized from the
+    # same chunk text with the same settings; --max changes show up as digests.
+    settings = {"repo": args.repo, "voice": voice_id, "speed": args.speed, "rate": args.rate}
+    digests = [_chunk_digest(c) for c in chunks]
+    manifest_p = parts_dir / _MANIFEST_NAME
+    recorded = None if args.force else _read_manifest(parts_dir, settings)
+
+    # Resume: a full output newer than the input and than the manifest of a
+    # complete, matching set of parts means this file is already done
+    final = args.final.lower()
+    if final in ("wav", "mp3") and recorded == digests:
+        full_out = item_root / f"{base}-full.{final}"
+        if _is_up_to_date(full_out, f) and _is_up_to_date(full_out, manifest_p):
+            if not quiet:
+                notice(f"[SKIP] {full_out} is up to date")
+            return {
+                "input": str(f),
+                "base": base,
+                "chunks": len(chunks),
+                "parts_dir": str(parts_dir),
+                "full_wav": str(full_out) if final == "wav" else None,
+                "full_mp3": str(full_out) if final == "mp3" else None,
+                "status": "ok",
+                "skipped": True,
+                "elapsed_sec": round(time.perf_counter() - started, 3),
+            }
+
+    # ...otherwise only synthesize the chunks whose part WAV isn't usable
+    reuse = set()
+    if recorded is not None:
+        reuse = {
+            i
+            for i, d in enumerate(digests[: len(recorded)], 1)
+            if recorded[i - 1] == d
+            and _part_reusable(_part_path(parts_dir, base, i), f, args.rate)
+        }
+    todo = [i for i in range(1, len(chunks) + 1) if i not in reuse]
+    if verbose and reuse:
+        log(f"Reusing {len(reuse)} existing part(s)")
+
+    # Parts about to be (re)written are unknown until the writer records them,
+    # so an interrupted run never leaves a manifest vouching for stale audio.
+    parts = [d if i in reuse else None for i, d in enumerate(digests, 1)]
+    _write_manifest(parts_dir, settings, parts)
+
+    def record(i: int):
+        parts[i - 1] = digests[i - 1]
+        _write_manifest(parts_dir, settings, parts)
+
+    wav_paths: list[Path] = []
+    ok_file = True
+
+    # Part WAVs are written on a separate thread so disk I/O overlaps the next
+    # chunk's inference; the bounded queue caps memory at two pending buffers.
+    q: queue.Queue = queue.Queue(maxsize=2)
+    write_errors: list[tuple[Path, Exception]] = []
+    writer = threading.Thread(
+        target=_part_writer, args=(q, write_errors, record), daemon=True
+    )
+    writer.start()
+
+    # --final wav keeps one int16 buffer per file: each segment is converted
+    # straight into its slice and parts are written from views of it, so the
+    # full WAV is a single write. Other modes read the parts back from disk, so
+    # each part gets its own buffer and only the few queued for writing stay
+    # alive. Sized from a generous ~12 chars/sec estimate; grown if exceeded.
+    keep_full = final == "wav"
+    per_char = args.rate / 12 / max(args.speed, 0.1)
+    est = sum(len(c) for c in chunks) if keep_full else 0
+    full = np.empty(int(est * per_char), dtype=np.int16)
+    off = total = 0
+    cur, cur_start = None, 0
+
+    def reserve(n: int) -> np.ndarray:
+        nonlocal full
+        if off + n > full.size:
+            grown = np.empty(max(off + n, full.size * 3 // 2), dtype=np.int16)
+            grown[:off] = full[:off]
+            full = grown
+        return full[off : off + n]
+
+    def emit_part():
+        wav_p = _part_path(parts_dir, base, cur)
+        q.put((wav_p, full[cur_start:off], args.rate, cur))
+        wav_paths.append(wav_p)
+        if prog_on:
+            _print_progress(base, cur, len(chunks), started, quiet)
+
+    def load_reused(upto: int):
+        # account for reused parts numbered below `upto`, in chunk order; only
+        # --final wav needs their samples in the buffer
+        nonlocal off
+        while len(wav_paths) + 1 < upto:
+            i = len(wav_paths) + 1
+            if i not in reuse:
+                raise RuntimeError("kokoro produced no audio")
+            wav_p = _part_path(parts_dir, base, i)
+            if keep_full:
+                pcm = read_wav_pcm16(wav_p)
+                reserve(pcm.size)[:] = pcm
+                off += pcm.size
+            wav_paths.append(wav_p)
+
+    try:
+        segments = ()
+        if todo:
+            segments = synth_segments(
+                pipe, [chunks[i - 1] for i in todo], voice=voice_id, speed=args.speed
+            )
+        for k, audio in segments:
+            if write_errors:
+                break
+            i = todo[k - 1]
+            if i != cur:
+                if cur is not None:
+                    emit_part()
+                load_reused(i)
+                if not keep_full:
+                    full, off = np.empty(int(len(chunks[i - 1]) * per_char), dtype=np.int16), 0
+                cur, cur_start = i, off
+            audio = as_samples(audio)  # device tensors arrive already as int16
+            n = audio.size
+            float_to_pcm16(audio, reserve(n))
+            off += n
+            total += n
+        else:
+            if cur is not None:
+                emit_part()
+            load_reused(len(chunks) + 1)
+    except Exception as ex:
+        ok_file = False
+        err(f"{f} chunk {len(wav_paths) + 1}: {ex}")
+    finally:
+        q.put(None)
+        writer.join()
+
+    if write_errors:
+        ok_file = False
+        wav_p, ex = write_errors[0]
+        err(f"{f} {wav_p.name}: {ex}")
+    elif ok_file and final in ("wav", "mp3") and not (wav_paths and (total or reuse)):
+        # empty text or silent output: nothing to combine, don't write a bare header
+        ok_file = False
+        err(f"{f}: no audio produced")
+
+    file_entry = {
+        "input": str(f),
+        "base": base,
+        "chunks": len(wav_paths),
+        "parts_dir": str(parts_dir),
+        "full_wav": None,
+        "full_mp3": None,
+        "status": "ok" if ok_file else "failed",
+        "skipped": False,
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+    }
+
+    # Combine (MP3 mode pipes the parts straight into the encoder instead)
+    if ok_file and args.final.lower() == "wav":
+        try:
+            full_wav = item_root / f"{base}-full.wav"
+            write_wav_file(full_wav, full[:off], args.rate)
+            if not quiet:
+                notice(f"[WAV] {full_wav}")
+            file_entry["full_wav"] = str(full_wav)
+        except Exception as ex:
+            file_entry["status"] = "failed"
+            err(f"Combine failed for {f}: {ex}")
+
+    return file_entry
+
+
+def _bounded_map(executor: ProcessPoolExecutor, fn, items, window: int) -> Iterator:
+    """
+    Like executor.map(), but with at most `window` calls in flight, so a lazy
+    input walk isn't drained into futures before the first result comes back.
+    Results are yielded in input order.
+    """
+    inflight = deque()
+    for item in items:
+        if len(inflight) >= window:
+            yield inflight.popleft().result()
+        inflight.append(executor.submit(fn, item))
+    while inflight:
+        yield inflight.popleft().result()
+
+
 # ----------------------------
 # Commands
 # ----------------------------
@@ -318,27 +806,22 @@ def cmd_synth(args):
         err(f"Input path not found: {inp}")
         sys.exit(2)
     inputs = collect_inputs(inp, args.recursive)
-    if not inputs:
+    # peek just far enough to know whether there is anything (or more than one file) to do
+    head = list(itertools.islice(inputs, 2))
+    if not head:
         err("No .txt files found.")
         sys.exit(1)
+    inputs = itertools.chain(head, inputs)
 
     # dry-run: show chunk counts then exit
     if args.dry_run:
         notice("Dry run: computing chunks only")
         for f in inputs:
             text = read_text(f)
-            chunks = split_smart(text, max(400, args.max))
+            chunks = _chunks_cached(text, max(400, args.max), _chunk_cache_dir(args))
             print(f"- {f} -> {len(chunks)} chunks (max={args.max})")
         return
 
-    # load Kokoro pipeline
-    if verbose:
-        log(f"Loading Kokoro pipeline lang={lang} repo={args.repo} ...")
-    t0 = time.perf_counter()
-    pipe = KPipeline(lang_code=lang, repo_id=args.repo)
-    if verbose:
-        log(f"Pipeline ready in {time.perf_counter() - t0:0.2f}s")
-
     out_root = Path(args.out)
     summary = {
         "repo": args.repo,
@@ -349,84 +832,153 @@ def cmd_synth(args):
         "encoder": None,
     }
 
-    prog_on = _progress_enabled(args.progress)
-    any_failed = False
-
-    for f in inputs:
-        started = time.perf_counter()
-        base = slug(f.stem)
-        item_root = out_root / base
-        parts_dir = item_root / "parts"
-        parts_dir.mkdir(parents=True, exist_ok=True)
-
-        if not quiet:
-            print(f"\n=== Synthesizing {f} -> {item_root} ===", flush=True)
-
-        text = read_text(f)
-        chunks = split_smart(text, max(400, args.max))
+    # Files are independent, so fan them out over a process pool, a bounded
+    # window at a time, with results in input order. A single job/file stays
+    # in-process.
+    jobs = ((f, args, voice_id, lang, out_root, verbose, quiet) for f in inputs)
+    executor = None
+    if args.jobs > 1 and len(head) > 1:
+        # each worker pins its torch threads and loads its pipeline once, up front;
+        # by default the cores are split evenly between workers
+        workers = args.jobs
+        threads = args.intra_threads or max(1, (os.cpu_count() or 1) // workers)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(lang, args.repo, threads),
+        )
+        results = _bounded_map(executor, _synth_one_file, jobs, 2 * workers)
+    else:
+        if args.intra_threads:
+            set_torch_threads(args.intra_threads)
+        if verbose:
+            log(f"Loading Kokoro pipeline lang={lang} repo={args.repo} ...")
+        t0 = time.perf_counter()
+        warm_pipeline(lang, args.repo)
         if verbose:
-            log(f"Chunks: {len(chunks)}  (max={args.max})")
+            log(f"Pipeline ready in {time.perf_counter() - t0:0.2f}s")
+        results = map(_synth_one_file, jobs)
 
-        wav_paths: list[Path] = []
-        ok_file = True
+    # MP3 encoders run in the background while the next file synthesizes;
+    # capped so they don't oversubscribe the cores TTS is using.
+    max_encoders = max(1, (os.cpu_count() or 2) // 2)
+    pending: list[tuple[subprocess.Popen, str, dict, Path]] = []
 
-        for i, ch in enumerate(chunks, 1):
+    # Each finished file is appended to a JSONL sidecar right away, so a crash
+    # mid-batch still leaves a usable report next to --summary-json.
+    sidecar = None
+    if args.summary_json:
+        try:
+            outp = Path(args.summary_json)
+            outp.parent.mkdir(parents=True, exist_ok=True)
+            sidecar = open(f"{outp}.jsonl", "a", encoding="utf-8")
+        except Exception as ex:
+            warn(f"Failed to open summary sidecar: {ex}")
+
+    def done(file_entry: dict):
+        nonlocal sidecar
+        if sidecar is None:
+            return
+        try:
+            sidecar.write(json.dumps(file_entry) + "\n")
+            sidecar.flush()
+        except OSError as ex:
+            # the sidecar is best-effort; the batch and the final summary go on
+            warn(f"Failed to append to summary sidecar: {ex}")
             try:
-                audio = synth_file(pipe, ch, voice=voice_id, speed=args.speed)
-                wav_p = parts_dir / f"{base}-part-{i:04d}.wav"
-                write_wav_file(wav_p, audio, args.rate)
-                wav_paths.append(wav_p)
-                if prog_on:
-                    _print_progress(base, i, len(chunks), started, quiet)
-                time.sleep(0.02)  # small breather to be polite
-            except Exception as ex:
-                any_failed = True
-                ok_file = False
-                err(f"{f} chunk {i}: {ex}")
-                break
+                sidecar.close()
+            except OSError:
+                pass
+            sidecar = None
+
+    def keep_wav(file_entry: dict, why: str):
+        # fallback when MP3 isn't possible: combine the parts on disk instead
+        full_wav = Path(file_entry["parts_dir"]).parent / f"{file_entry['base']}-full.wav"
+        try:
+            combine_wavs(_part_paths(file_entry), full_wav)
+            file_entry["full_wav"] = str(full_wav)
+            warn(f"{why}; kept WAV only.")
+        except Exception as ex:
+            file_entry["status"] = "failed"
+            err(f"Combine failed for {file_entry['input']}: {ex}")
 
-        file_entry = {
-            "input": str(f),
-            "base": base,
-            "chunks": len(wav_paths),
-            "parts_dir": str(parts_dir),
-            "full_wav": None,
-            "full_mp3": None,
-            "status": "ok" if ok_file else "failed",
-            "elapsed_sec": round(time.perf_counter() - started, 3),
-        }
+    def finish_mp3(proc: subprocess.Popen, enc_name: str, file_entry: dict, out_mp3: Path):
+        if proc.wait() == 0:
+            # encoders write to a partial name so a killed run can't look finished
+            try:
+                os.replace(_partial_mp3(out_mp3), out_mp3)
+            except OSError as ex:
+                keep_wav(file_entry, f"MP3 output missing for {file_entry['input']} ({ex})")
+                done(file_entry)
+                return
+            file_entry["full_mp3"] = str(out_mp3)
+            summary["encoder"] = summary["encoder"] or enc_name
+            if not quiet:
+                notice(f"[MP3] {out_mp3} (via {enc_name})")
+        else:
+            keep_wav(file_entry, f"MP3 encoder failed for {file_entry['input']}")
+        done(file_entry)
+
+    try:
+        for file_entry in results:
+            summary["inputs"].append(file_entry)
+
+            # reap encoders that already finished
+            running = []
+            for item in pending:
+                if item[0].poll() is None:
+                    running.append(item)
+                else:
+                    finish_mp3(*item)
+            pending = running
+
+            if (
+                args.final.lower() != "mp3"
+                or file_entry["status"] != "ok"
+                or file_entry["full_mp3"]
+            ):
+                done(file_entry)
+                continue
 
-        # Combine + encode
-        if ok_file and args.final.lower() in ("wav", "mp3"):
+            while len(pending) >= max_encoders:
+                finish_mp3(*pending.pop(0))
+            out_mp3 = Path(file_entry["parts_dir"]).parent / f"{file_entry['base']}-full.mp3"
             try:
-                full_wav = item_root / f"{base}-full.wav"
-                combine_wavs(wav_paths, full_wav)
-                if not quiet:
-                    notice(f"[WAV] {full_wav}")
-                file_entry["full_wav"] = str(full_wav)
-
-                if args.final.lower() == "mp3":
-                    success, enc_name = encode_mp3(full_wav, item_root / f"{base}-full.mp3")
-                    if success:
-                        file_entry["full_mp3"] = str(item_root / f"{base}-full.mp3")
-                        summary["encoder"] = summary["encoder"] or enc_name
-                        if not quiet:
-                            notice(f"[MP3] {file_entry['full_mp3']} (via {enc_name})")
-                    else:
-                        warn("MP3 encoder not found or failed; kept WAV only.")
+                proc, enc_name = start_encode_mp3(_part_paths(file_entry), _partial_mp3(out_mp3))
             except Exception as ex:
-                any_failed = True
                 file_entry["status"] = "failed"
-                err(f"Combine/encode failed for {f}: {ex}")
-
-        summary["inputs"].append(file_entry)
-
-    # write JSON summary if requested
+                err(f"Encode failed for {file_entry['input']}: {ex}")
+                done(file_entry)
+                continue
+            if proc is None:
+                keep_wav(file_entry, "MP3 encoder not found")
+                done(file_entry)
+            else:
+                pending.append((proc, enc_name, file_entry, out_mp3))
+
+        for item in pending:
+            finish_mp3(*item)
+    except BaseException:
+        # don't let queued files keep synthesizing only to be thrown away
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = None
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if sidecar is not None:
+            sidecar.close()
+
+    any_failed = any(x["status"] != "ok" for x in summary["inputs"])
+
+    # write JSON summary if requested; tmp + rename so readers never see a partial file
     if args.summary_json:
         try:
             outp = Path(args.summary_json)
-            outp.parent.mkdir(parents=True, exist_ok=True)
-            outp.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+            tmp = Path(str(outp) + ".tmp")
+            tmp.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+            os.replace(tmp, outp)
             if not quiet:
                 notice(f"Summary written to {outp}")
         except Exception as ex:
@@ -478,6 +1030,20 @@ def main():
         default="mp3",
         help="Final combined output type",
     )
+    ap_s.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Input files synthesized in parallel (worker processes)",
+    )
+    ap_s.add_argument(
+        "--intra-threads",
+        type=int,
+        default=0,
+        help="Torch threads per process (default: torch's own with one job, "
+        "cores split evenly across --jobs workers otherwise)",
+    )
     ap_s.add_argument(
         "--recursive", action="store_true", help="Recurse into subfolders (if input is a dir)"
     )
@@ -493,6 +1059,16 @@ def main():
     ap_s.add_argument(
         "--dry-run", action="store_true", help="Parse inputs & show planned chunks, then exit"
     )
+    ap_s.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-synthesize even when full outputs or part WAVs are up to date",
+    )
+    ap_s.add_argument(
+        "--no-chunk-cache",
+        action="store_true",
+        help="Don't read/write chunk boundaries cached under <out>/.cache/chunks",
+    )
     ap_s.add_argument("--verbose", action="store_true", help="Verbose output")
     ap_s.add_argument("--quiet", action="store_true", help="Minimal output")
     ap_s.add_argument(
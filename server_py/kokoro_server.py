@@ -1,14 +1,17 @@
 import os, sys
 sys.path.insert(0, os.path.dirname(__file__))
 
-import io, time, wave, argparse, grpc, warnings
+import time, argparse, grpc, warnings
 from concurrent import futures
-import numpy as np
 
 from kokoro import KPipeline
 from api.tts.v1 import tts_pb2, tts_pb2_grpc
+from _audio_util import WAV_STREAM_LEN, float_to_pcm16, wav_header
+from _kokoro_pool import get_pipeline
+import _pcm
 
 DEFAULT_SR = 24000
+STREAM_CHUNK = 32 * 1024  # bytes per AudioChunk message
 
 # Silence specific noisy warnings
 warnings.filterwarnings("ignore",
@@ -44,13 +47,9 @@ class TTSServicer(tts_pb2_grpc.TTSServicer):
         self.default_lang  = default_lang
         self.default_voice = default_voice
         self.repo_id       = repo_id
-        self._pipelines    = {}  # lang_code -> KPipeline
 
     def _get_pipeline(self, lang_code: str) -> KPipeline:
-        if lang_code not in self._pipelines:
-            # 👇 pass repo_id to suppress “Defaulting repo_id …” warning
-            self._pipelines[lang_code] = KPipeline(lang_code=lang_code, repo_id=self.repo_id)
-        return self._pipelines[lang_code]
+        return get_pipeline(lang_code, self.repo_id)
 
     def ListVoices(self, request, context):
         resp = tts_pb2.ListVoicesResponse()
@@ -72,27 +71,21 @@ class TTSServicer(tts_pb2_grpc.TTSServicer):
 
         pipe = self._get_pipeline(lang)
 
-        parts = []
+        # Stream audio as Kokoro produces it: one WAV header with streamed-WAV
+        # placeholder sizes (0xFFFFFFFF), then each segment's PCM right away.
+        # Clients needing exact RIFF sizes patch them from the bytes received.
+        header_sent = False
         for _, _, audio in pipe(text, voice=voice, speed=float(speed)):
-            parts.append(np.asarray(audio, dtype=np.float32).flatten())
-        if not parts:
+            if audio is None:
+                continue
+            if not header_sent:
+                yield tts_pb2.AudioChunk(audio=wav_header(1, 2, sample_rate, WAV_STREAM_LEN))
+                header_sent = True
+            data = float_to_pcm16(audio).tobytes()
+            for i in range(0, len(data), STREAM_CHUNK):
+                yield tts_pb2.AudioChunk(audio=data[i:i+STREAM_CHUNK])
+        if not header_sent:
             context.abort(grpc.StatusCode.INTERNAL, "kokoro produced no audio")
-        wav = np.concatenate(parts, axis=0)
-
-        data = audio_to_wav_bytes(wav, sample_rate=sample_rate)
-        CHUNK = 32 * 1024
-        for i in range(0, len(data), CHUNK):
-            yield tts_pb2.AudioChunk(audio=data[i:i+CHUNK])
-
-def audio_to_wav_bytes(audio: np.ndarray, sample_rate: int = DEFAULT_SR) -> bytes:
-    audio = np.clip(audio, -1.0, 1.0)
-    pcm = (audio * 32767.0).astype(np.int16)
-    import io, wave
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as w:
-        w.setnchannels(1); w.setsampwidth(2); w.setframerate(sample_rate)
-        w.writeframes(pcm.tobytes())
-    return buf.getvalue()
 
 def main():
     p = argparse.ArgumentParser()
@@ -101,12 +94,27 @@ def main():
     p.add_argument("--voice",  default="af_heart")
     p.add_argument("--repo",   default=os.environ.get("KOKORO_REPO_ID", "hexgrad/Kokoro-82M"),
                    help="HuggingFace repo id for Kokoro (default: hexgrad/Kokoro-82M)")
+    p.add_argument("--workers", type=int, default=int(os.environ.get("KOKORO_WORKERS", os.cpu_count() or 4)),
+                   help="gRPC handler threads (default: $KOKORO_WORKERS or CPU count)")
+    p.add_argument("--compression", choices=["gzip", "none"], default="gzip",
+                   help="Response compression for clients that accept it (default: gzip)")
     args = p.parse_args()
 
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    _pcm.warm()  # JIT the PCM kernel before the first request
+
+    # SO_REUSEPORT lets several server processes share --listen, sidestepping the GIL
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=args.workers),
+        compression=grpc.Compression.Gzip if args.compression == "gzip" else grpc.Compression.NoCompression,
+        options=[
+            ("grpc.max_send_message_length", 64 << 20),
+            ("grpc.so_reuseport", 1),
+        ],
+    )
     tts_pb2_grpc.add_TTSServicer_to_server(TTSServicer(args.lang, args.voice, args.repo), server)
     server.add_insecure_port(args.listen)
-    print(f"[kokoro] gRPC on {args.listen} (lang={args.lang} voice={args.voice} repo={args.repo})", flush=True)
+    print(f"[kokoro] gRPC on {args.listen} (lang={args.lang} voice={args.voice} repo={args.repo} "
+          f"workers={args.workers} compression={args.compression})", flush=True)
     server.start()
     try:
         while True: time.sleep(86400)
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from kokoro_cli import _chunks_cached, split_smart
+
+# Golden chunks from the original findall/join implementation of split_smart,
+# which the offset-based _chunk_spans must reproduce exactly.
+GOLDEN = [
+    ("One. Two two! Three three three? Four.", 12,
+     ["One.", "Two two!", "Three three", "three? Four."]),
+    ("One. Two two! Three three three? Four.", 20,
+     ["One. Two two!", "Three three three?", "Four."]),
+    # \r\n is normalized; blank lines end a sentence but stay inside a chunk
+    ("First line\r\nstill first.\r\n\r\nSecond para.\r\n\r\n\r\nThird", 15,
+     ["First", "line\nstill", "first.", "Second para.", "Third"]),
+    ("First line\r\nstill first.\r\n\r\nSecond para.\r\n\r\n\r\nThird", 40,
+     ["First line\nstill first.\n\nSecond para.", "Third"]),
+    # closing quotes and brackets stay with their sentence
+    ("He said \"Stop!\" Then left. (Really?) Yes.'", 10,
+     ["He said", "\"Stop!\"", "Then", "left.", "(Really?)", "Yes.'"]),
+    ("He said \"Stop!\" Then left. (Really?) Yes.'", 30,
+     ["He said \"Stop!\" Then left.", "(Really?) Yes.'"]),
+    # hard wrap at the last space, or mid-word when there is none
+    ("alpha beta gamma delta epsilon zeta eta theta iota kappa", 12,
+     ["alpha beta", "gamma delta", "epsilon", "zeta eta", "theta iota", "kappa"]),
+    ("alpha beta gamma delta epsilon zeta eta theta iota kappa", 20,
+     ["alpha beta gamma", "delta epsilon zeta", "eta theta iota kappa"]),
+    ("abcdefghijklmnopqrstuvwxyz end.", 10,
+     ["abcdefghij", "klmnopqrst", "uvwxyz", "end."]),
+    ("A\t\tb  c.   D \f e!", 5, ["A b", "c.", "D e!"]),
+    ("A\t\tb  c.   D \f e!", 50, ["A b c. D e!"]),
+    ("", 10, []),
+    ("   \n\n  ", 10, [""]),
+]
+
+
+@pytest.mark.parametrize("text,max_chars,expected", GOLDEN)
+def test_split_smart_matches_golden(text, max_chars, expected):
+    assert split_smart(text, max_chars) == expected
+
+
+@pytest.mark.parametrize("bad", [
+    "not json",
+    "{}",
+    "[]",
+    "[[0, 13], [14, 32], [33, 38]]",
+    '{"n": 38, "spans": []}',
+    '{"n": 38, "spans": [[0, 13]]}',
+    '{"n": 37, "spans": [[0, 13], [14, 32], [33, 38]]}',
+    '{"n": 38, "spans": [[0, 13], [14, 32], [33, 99]]}',
+    '{"n": 38, "spans": [[14, 32], [0, 13], [33, 38]]}',
+    '{"n": 38, "spans": [[0, 20], [14, 32], [33, 38]]}',
+    '{"n": 38, "spans": [[0, 13], [14, 32], [38, 33]]}',
+    '{"n": 38, "spans": ["x"]}',
+])
+def test_chunks_cached_recomputes_bad_cache(tmp_path, bad):
+    text = "One. Two two! Three three three? Four."
+    _chunks_cached(text, 20, tmp_path)
+    (cache_p,) = tmp_path.glob("*.json")
+    cache_p.write_text(bad, encoding="utf-8")
+    assert _chunks_cached(text, 20, tmp_path) == split_smart(text, 20)
+    assert json.loads(cache_p.read_text(encoding="utf-8")) == {
+        "n": 38,
+        "spans": [[0, 13], [14, 32], [33, 38]],
+    }
+
+
+@pytest.mark.parametrize("text,max_chars,expected", GOLDEN)
+def test_chunks_cached_round_trip(tmp_path, text, max_chars, expected):
+    assert _chunks_cached(text, max_chars, tmp_path) == expected
+    assert _chunks_cached(text, max_chars, tmp_path) == expected